@@ -4,16 +4,81 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 
 import tkinter as tk
 from tkinter import filedialog, ttk
 from scipy.signal import find_peaks
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Falls back to the plain Python function when Numba is not installed.
+        """
+        return lambda function: function
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+CSV_DTYPES = {'TrialIndex': 'int32', 'TrialNo': 'int32'}
+STATUS_DTYPE = pd.CategoricalDtype(['Accepted', 'Rejected'])
+
 
-def select_csv_file():
+@njit(cache=True, nogil=True)
+def peak_to_trough_kernel(trial_values, positive_peaks, negative_peaks):
+    """
+    Calculates the amplitude of each peak relative to its adjacent troughs.
+    """
+    # Initialize an array of zeros for the amplitudes
+    peak_to_trough_amplitudes = np.zeros_like(trial_values)
+
+    # Both peak arrays are sorted, so a single walk over the troughs finds
+    # the troughs adjacent to every peak
+    trough = 0
+    for peak in positive_peaks:
+        while (trough < negative_peaks.size
+               and negative_peaks[trough] < peak):
+            trough += 1
+
+        peak_value = trial_values[peak]
+        has_left = trough > 0
+        has_right = trough < negative_peaks.size
+
+        if has_left and has_right:
+            amplitude_left = peak_value - trial_values[
+                negative_peaks[trough - 1]]
+            amplitude_right = peak_value - trial_values[
+                negative_peaks[trough]]
+            amplitude = max(amplitude_left, amplitude_right)
+        elif has_left:
+            amplitude = peak_value - trial_values[negative_peaks[trough - 1]]
+        elif has_right:
+            amplitude = peak_value - trial_values[negative_peaks[trough]]
+        else:
+            amplitude = peak_value
+
+        # Set the peak-to-trough amplitude at the peak position
+        peak_to_trough_amplitudes[peak] = amplitude
+
+    return peak_to_trough_amplitudes
+
+
+def select_csv_file(parent=None):
     """
     Opens a dialog to select a CSV file and returns the selected file path.
+    A temporary root window is only created when no parent is given.
     """
+    if parent is not None:
+        return filedialog.askopenfilename(parent=parent,
+                                          title="Select dataset",
+                                          filetypes=[("CSV files", "*.csv")])
+
     root = tk.Tk()
     root.withdraw()
     file_path = filedialog.askopenfilename(title="Select dataset",
@@ -24,10 +89,15 @@ def select_csv_file():
 
 def load_csv(file_path):
     """
-    Loads a CSV file into a Pandas DataFrame.
+    Loads a CSV file into a Pandas DataFrame, using the multithreaded PyArrow
+    parser when it is installed. The repetitive text columns are stored as
+    categoricals.
     """
     try:
-        return pd.read_csv(file_path)
+        df = pd.read_csv(file_path, engine=CSV_ENGINE, dtype=CSV_DTYPES)
+        for column in ['Session', 'TrialName']:
+            df[column] = df[column].astype('category')
+        return df
     except Exception as e:
         print(f"Error loading the file: {e}")
         return None
@@ -35,11 +105,19 @@ def load_csv(file_path):
 
 def add_accepted_status_column(df):
     """
-    Adds a 'Status' column to the DataFrame, defaulting to 'Accepted'.
+    Adds a categorical 'Status' column to the DataFrame, defaulting to
+    'Accepted'.
     """
     if 'Status' not in df.columns:
         df['Status'] = 'Accepted'
-    df.loc[df['TrialName'].str.contains('wav', case=False, regex=True), 'Status'] = 'Rejected'
+    # Match the distinct trial names only and map the result back to the
+    # rows through the category codes
+    trial_names = df['TrialName'].astype('category')
+    is_wav_name = trial_names.cat.categories.str.contains('wav', case=False,
+                                                          regex=False)
+    is_wav_trial = trial_names.cat.codes.isin(np.flatnonzero(is_wav_name))
+    df.loc[is_wav_trial, 'Status'] = 'Rejected'
+    df['Status'] = df['Status'].astype(STATUS_DTYPE)
     return df
 
 
@@ -62,15 +140,19 @@ class TrialApp(tk.Tk):
         self.data_frame = df
         self.original_file_name = original_file_name
         self.current_trial_index = 0
-        self.rejected_trials_list = []
+        self.update_dataset_cache()
+        self.rejected_trials = {}
+        self.rejected_trial_items = {}
         self.enclosure_max = 1
         self.enclosure_min = -0.5
         self.y_max_variable = tk.StringVar(value=str(self.enclosure_max))
         self.y_min_variable = tk.StringVar(value=str(self.enclosure_min))
         self.is_autoscale_enabled = False
+        self.is_plot_update_pending = False
         self.style = ttk.Style()
         self.default_font = 'Segoe UI'
         self.configure_styles(self.style)
+        plt.style.use('seaborn-v0_8-whitegrid')
         self.initialize_user_interface()
         self.protocol("WM_DELETE_WINDOW", self.close_application)
 
@@ -109,6 +191,7 @@ class TrialApp(tk.Tk):
         self.create_rejected_trials_frame()
 
         self.bind_event_handlers()
+        self.update_plot()
 
     def create_main_container(self):
         """
@@ -236,6 +319,7 @@ class TrialApp(tk.Tk):
         self.plot_frame = ttk.Frame(self.container)
         self.plot_frame.grid(row=0, column=1, sticky="nsew", padx=(0, 20),
                              pady=(32, 53))
+        self.create_trial_plot()
 
     def create_rejected_trials_frame(self):
         """
@@ -246,6 +330,20 @@ class TrialApp(tk.Tk):
         self.rejected_trials_frame.grid(row=0, column=2, sticky="nsew",
                                         padx=(0, 20), pady=(21, 53))
 
+        self.rejected_trials_tree = ttk.Treeview(self.rejected_trials_frame,
+                                                 selectmode='none',
+                                                 show="tree")
+        self.rejected_trials_tree['columns'] = 0
+        self.rejected_trials_tree.column("#0", width=0, stretch=tk.NO,
+                                         anchor="w")
+
+        scrollbar = ttk.Scrollbar(self.rejected_trials_frame,
+                                  command=self.rejected_trials_tree.yview)
+        self.rejected_trials_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", pady=(8, 12))
+        self.rejected_trials_tree.pack(side="left", fill="both", expand=True,
+                                       pady=(2, 5))
+
     def bind_event_handlers(self):
         """
         Binds key event handlers to the application.
@@ -258,52 +356,47 @@ class TrialApp(tk.Tk):
         """
         Updates the plot based on the current state of the application.
         """
-        if hasattr(self, 'fig'):
-            plt.close(self.fig)
-
+        self.is_plot_update_pending = False
         if self.data_frame.empty:
-            self.fig, ax = plt.subplots()
-            ax.set_title('No Data Loaded', fontsize=14)
-            ax.set_xlabel('X-axis')
-            ax.set_ylabel('Y-axis')
+            self.trial_line.set_data([], [])
+            self.status_title.set_text('No Data Loaded')
+            self.trial_name_text.set_text('')
+            self.trial_info_text.set_text('')
         else:
-            trial_data = self.data_frame.iloc[self.current_trial_index:
-                                              self.current_trial_index + 500]
+            trial_block = self.current_trial_index // 500
             self.update_trial_info_label()
-            self.fig = self.create_trial_plot(trial_data)
-
-            if hasattr(self, 'plot_canvas'):
-                self.plot_canvas.get_tk_widget().pack_forget()
-                self.plot_canvas.get_tk_widget().destroy()
+            self.update_trial_plot(self.time_values[trial_block],
+                                   self.net_force[trial_block])
+            self.set_plot_titles(
+                self.data_frame.iloc[self.current_trial_index])
 
-            self.plot_canvas = FigureCanvasTkAgg(self.fig,
-                                                 master=self.plot_frame)
-            self.plot_canvas.draw()
-            self.plot_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True,
-                                                  padx=0, pady=0)
+        self.plot_canvas.draw_idle()
 
-    def create_trial_plot(self, trial_data):
+    def create_trial_plot(self):
         """
-        Creates a plot for the given trial data segment with transformed data to show peaks.
+        Creates the figure, canvas and artists that are reused for every
+        trial plot.
         """
-        median_encl1 = trial_data['Encl 1'].median()
-        net_force = trial_data['Encl 1'] - median_encl1
-
-#        peak_to_trough_amplitudes = self.calculate_peak_to_trough_amplitudes(
-#            net_force)
-#        baseline_to_peak_amplitudes = self.calculate_baseline_to_peak_amplitudes(
- #           net_force)
-
-        plt.style.use('seaborn-v0_8-whitegrid')
         #fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 15), sharex=True)
-        fig, (ax1) = plt.subplots(1, 1, figsize=(12, 15), sharex=True)
-        fig.subplots_adjust(left=0.075, right=0.925, top=0.95, bottom=0.05)
-
-        ax1.plot(trial_data['Time(ms)'], net_force,
-                 color='dodgerblue', linestyle='-', linewidth=2.5)
-        ax1.set_ylabel('Amplitude (N)', fontsize=12, fontname="Segoe UI")
-        ax1.grid(True, linestyle='--', linewidth=0.25, color='grey', alpha=0.5)
-        ax1.axvspan(300, 320, color='gray', alpha=0.5, label='Time Range 300-320 ms')
+        self.fig = Figure(figsize=(12, 15))
+        self.ax1 = self.fig.add_subplot(1, 1, 1)
+        self.fig.subplots_adjust(left=0.075, right=0.925, top=0.95,
+                                 bottom=0.05)
+        self.ax1.xaxis.set_major_locator(
+            MaxNLocator(6, steps=[1, 2, 2.5, 5, 10]))
+        self.ax1.yaxis.set_major_locator(
+            MaxNLocator(6, steps=[1, 2, 2.5, 5, 10]))
+        self.ax1.minorticks_off()
+
+        self.trial_line, = self.ax1.plot([], [], color='dodgerblue',
+                                         linestyle='-', linewidth=2.5,
+                                         antialiased=True,
+                                         solid_joinstyle='round')
+        self.ax1.set_ylabel('Amplitude (N)', fontsize=12, fontname="Segoe UI")
+        self.ax1.grid(True, linestyle='--', linewidth=0.25, color='grey',
+                      alpha=0.5)
+        self.ax1.axvspan(300, 320, color='gray', alpha=0.5,
+                         label='Time Range 300-320 ms')
 
         #        ax2.plot(trial_data['Time(ms)'], peak_to_trough_amplitudes,
  #                color='dodgerblue', linestyle='-', linewidth=2.5)
@@ -316,59 +409,61 @@ class TrialApp(tk.Tk):
    #     ax3.set_ylabel('Baseline to Peak Amplitude (N)', fontsize=12, fontname="Segoe UI")
     #    ax3.grid(True, linestyle='--', linewidth=0.25, color='grey', alpha=0.5)"""
 #
+        self.status_title = self.ax1.set_title('', fontsize=14,
+                                               fontname="Segoe UI")
+        self.trial_name_text = self.ax1.text(
+            0.025, 0.98, '', fontsize=10, fontweight='bold',
+            fontname="Segoe UI", ha='left', va='top',
+            transform=self.ax1.transAxes)
+        self.trial_info_text = self.ax1.text(
+            0.975, 0.98, '', fontsize=10, fontweight='bold',
+            fontname="Segoe UI", ha='right', va='top',
+            transform=self.ax1.transAxes)
+
+        self.plot_canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.plot_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True,
+                                              padx=0, pady=0)
+
+    def update_trial_plot(self, time_values, net_force):
+        """
+        Updates the plot artists with the given baseline-corrected trial data
+        segment to show peaks.
+        """
+#        peak_to_trough_amplitudes = self.calculate_peak_to_trough_amplitudes(
+#            net_force)
+#        baseline_to_peak_amplitudes = self.calculate_baseline_to_peak_amplitudes(
+ #           net_force)
+
+        self.trial_line.set_data(time_values, net_force)
+        self.ax1.relim()
+        self.ax1.autoscale_view(scaley=False)
+
         y_min1, y_max1 = self.calculate_y_axis_limits(net_force)
   #      y_min2, y_max2 = self.calculate_y_axis_limits(peak_to_trough_amplitudes)
    #     y_min3, y_max3 = self.calculate_y_axis_limits(baseline_to_peak_amplitudes)
 
-        ax1.set_ylim(y_min1, y_max1)
+        self.ax1.set_ylim(y_min1, y_max1)
 #        ax2.set_ylim(y_min2, y_max2)
  #       ax3.set_ylim(y_min3, y_max3)
 
-        self.set_plot_titles(ax1, trial_data)
-        return fig
-
     def calculate_peak_to_trough_amplitudes(self, trial):
-        positive_peaks, _ = find_peaks(trial.values, width=1,
+        trial_values = np.ascontiguousarray(trial, dtype=np.float64)
+        positive_peaks, _ = find_peaks(trial_values, width=1,
                                        prominence=0.025)
-        negative_peaks, _ = find_peaks(-trial.values, width=1,
+        negative_peaks, _ = find_peaks(-trial_values, width=1,
                                        prominence=0.025)
 
-        # Initialize an array of zeros for the amplitudes
-        peak_to_trough_amplitudes = np.zeros_like(trial)
-
-        for peak in positive_peaks:
-            left_troughs = negative_peaks[negative_peaks < peak]
-            right_troughs = negative_peaks[negative_peaks > peak]
-
-            left_trough = left_troughs[-1] if left_troughs.size > 0 else None
-            right_trough = right_troughs[0] if right_troughs.size > 0 else None
-
-            # Make sure we're within bounds when accessing the series
-            if left_trough is not None and right_trough is not None:
-                amplitude_left = trial.iloc[peak] - trial.iloc[left_trough]
-                amplitude_right = trial.iloc[peak] - trial.iloc[right_trough]
-                amplitude = max(amplitude_left, amplitude_right)
-            elif left_trough is not None:
-                amplitude = trial.iloc[peak] - trial.iloc[left_trough]
-            elif right_trough is not None:
-                amplitude = trial.iloc[peak] - trial.iloc[right_trough]
-            else:
-                amplitude = trial.iloc[peak]
-
-            # Set the peak-to-trough amplitude at the peak position
-            peak_to_trough_amplitudes[peak] = amplitude
-
-        return peak_to_trough_amplitudes
+        return peak_to_trough_kernel(trial_values, positive_peaks,
+                                     negative_peaks)
 
     def calculate_baseline_to_peak_amplitudes(self, trial):
-        positive_peaks, _ = find_peaks(trial.values,
+        trial_values = np.asarray(trial)
+        positive_peaks, _ = find_peaks(trial_values,
                                        height=0, width=1,
                                        prominence=0.025)
-        baseline_to_peak_amplitudes = np.zeros_like(trial)
-
-        for peak in positive_peaks:
-            amplitude = trial.iloc[peak]
-            baseline_to_peak_amplitudes[peak] = amplitude
+        baseline_to_peak_amplitudes = np.zeros_like(trial_values)
+        baseline_to_peak_amplitudes[positive_peaks] = trial_values[
+            positive_peaks]
 
         return baseline_to_peak_amplitudes
     def calculate_y_axis_limits(self, trial_data):
@@ -383,26 +478,15 @@ class TrialApp(tk.Tk):
             return float(self.y_min_variable.get()), float(
                 self.y_max_variable.get())
 
-    def set_plot_titles(self, ax, trial_data):
+    def set_plot_titles(self, first_row):
         """
         Sets titles and other information for the plot.
         """
-        first_row = trial_data.iloc[0]
-
-        ax.set_title(f'Status: {first_row["Status"]}', fontsize=14,
-                     fontname="Segoe UI")
-
-        ax.text(0.025, 0.98,
-                f'{first_row["Session"]} - No. {first_row["TrialNo"]} - '
-                f'{first_row["TrialName"]}',
-                fontsize=10, fontweight='bold', fontname="Segoe UI", ha='left',
-                va='top', transform=ax.transAxes)
-
-        if hasattr(self, 'trial_info_label'):
-            trial_info_text = self.trial_info_label.cget("text")
-            ax.text(0.975, 0.98, trial_info_text,
-                    fontsize=10, fontweight='bold', fontname="Segoe UI",
-                    ha='right', va='top', transform=ax.transAxes)
+        self.status_title.set_text(f'Status: {first_row["Status"]}')
+        self.trial_name_text.set_text(
+            f'{first_row["Session"]} - No. {first_row["TrialNo"]} - '
+            f'{first_row["TrialName"]}')
+        self.trial_info_text.set_text(self.trial_info_label.cget("text"))
 
     def calculate_autoscale_limits(self, data):
         """
@@ -416,37 +500,36 @@ class TrialApp(tk.Tk):
         """
         Updates the list of rejected trials based on the current DataFrame.
         """
-        self.rejected_trials_list.clear()
+        self.rejected_trials.clear()
+        self.clear_rejected_trials_treeview()
         if not self.data_frame.empty:
-            unique_trials = self.data_frame.drop_duplicates(
-                subset=['TrialIndex', 'Session'])
-            trial_index = 0
-            for idx, row in unique_trials.iterrows():
-                trial_index += 1
-                if self.data_frame.loc[idx, 'Status'] == 'Rejected':
-                    trial_info = self.construct_trial_info(trial_index, row)
-                    self.rejected_trials_list.append(trial_info)
-
-        self.populate_rejected_trials_treeview()
+            first_rows = self.data_frame.iloc[::500]
+            is_rejected = (first_rows['Status'] == 'Rejected').to_numpy()
+            trial_numbers = (np.flatnonzero(is_rejected) + 1).tolist()
+            rejected_rows = first_rows.loc[
+                is_rejected, ['Session', 'TrialIndex', 'TrialName']]
+            for trial_index, row in zip(trial_numbers,
+                                        rejected_rows.to_dict('records')):
+                trial_info = self.construct_trial_info(trial_index, row)
+                self.rejected_trials[trial_index] = trial_info
+                self.insert_rejected_trial(trial_index, trial_info)
 
     def update_trial_info_label(self):
         """
         Updates the information label with the current trial number.
         """
-        total_trials = len(self.data_frame) // 500
         self.current_trial_number = self.current_trial_index // 500 + 1 \
             if not self.data_frame.empty else 0
         self.trial_info_label.config(
             text=f"Displayed trial: {self.current_trial_number} / "
-                 f"{total_trials}")
+                 f"{self.total_trials}")
 
     def on_trial_number_entry(self, event):
         """
         Handles the event when a trial number is entered for navigation.
         """
         self.current_trial_number = int(self.trial_number_var.get())
-        total_trials = len(self.data_frame) // 500
-        if 1 <= self.current_trial_number <= total_trials:
+        if 1 <= self.current_trial_number <= self.total_trials:
             self.current_trial_index = (self.current_trial_number - 1) * 500
             self.update_plot()
 
@@ -465,23 +548,25 @@ class TrialApp(tk.Tk):
         Toggles the status of the current trial between 'Accepted' and
         'Rejected'.
         """
-        current_block = self.data_frame.iloc[
-                        self.current_trial_index:
-                        self.current_trial_index + 500]
-        new_status = 'Rejected' if current_block.iloc[0][
+        first_row = self.data_frame.iloc[self.current_trial_index]
+        new_status = 'Rejected' if first_row[
                                        'Status'] == 'Accepted' else 'Accepted'
-        self.data_frame.loc[current_block.index, 'Status'] = new_status
+        self.data_frame.iloc[self.current_trial_index:
+                             self.current_trial_index + 500,
+                             self.status_column_index] = new_status
 
-        trial_info = self.construct_trial_info(self.current_trial_number,
-                                               current_block.iloc[0])
+        trial_number = self.current_trial_index // 500 + 1
         if new_status == 'Rejected':
-            if trial_info not in self.rejected_trials_list:
-                self.rejected_trials_list.append(trial_info)
+            if trial_number not in self.rejected_trials:
+                trial_info = self.construct_trial_info(trial_number,
+                                                       first_row)
+                self.rejected_trials[trial_number] = trial_info
+                self.insert_rejected_trial(trial_number, trial_info)
         else:
-            if trial_info in self.rejected_trials_list:
-                self.rejected_trials_list.remove(trial_info)
+            if trial_number in self.rejected_trials:
+                del self.rejected_trials[trial_number]
+                self.delete_rejected_trial(trial_number)
 
-        self.populate_rejected_trials_treeview()
         self.update_plot()
 
     def construct_trial_info(self, trial_index, trial_row):
@@ -505,21 +590,37 @@ class TrialApp(tk.Tk):
         Navigates to the next trial.
         """
         self.current_trial_index = min(self.current_trial_index + 500,
-                                       len(self.data_frame) - 500)
-        self.update_plot()
+                                       (self.total_trials - 1) * 500)
+        self.schedule_plot_update()
 
     def prev_trial(self):
         """
         Navigates to the previous trial.
         """
         self.current_trial_index = max(0, self.current_trial_index - 500)
-        self.update_plot()
+        self.schedule_plot_update()
+
+    def schedule_plot_update(self):
+        """
+        Schedules a plot update for when the pending events are processed,
+        so that repeated key presses result in a single redraw.
+        """
+        if not self.is_plot_update_pending:
+            self.is_plot_update_pending = True
+            self.after_idle(self.process_pending_plot_update)
+
+    def process_pending_plot_update(self):
+        """
+        Updates the plot if an update has been scheduled.
+        """
+        if self.is_plot_update_pending:
+            self.update_plot()
 
     def load_new_file(self):
         """
         Loads a new CSV file and updates the application with the new data.
         """
-        new_csv_file = select_csv_file()
+        new_csv_file = select_csv_file(parent=self)
         if new_csv_file:
             new_df = load_csv(new_csv_file)
             if new_df is not None:
@@ -527,41 +628,29 @@ class TrialApp(tk.Tk):
                 new_df = sort_dataframe(new_df)
                 self.data_frame = new_df
                 self.current_trial_index = 0
+                self.update_dataset_cache()
                 self.update_enclosure_limits()
                 self.update_plot()
                 self.update_rejected_trials_list()
                 self.original_file_name = new_csv_file
 
-    def select_csv_file(self):
-        """
-        Opens a dialog to select a CSV file and returns the selected file path.
-        """
-        root = tk.Tk()
-        root.withdraw()
-        file_path = filedialog.askopenfilename(title="Select dataset",
-                                               filetypes=[
-                                                   ("CSV files", "*.csv")])
-        root.destroy()
-        return file_path
-
-    def load_csv(self, file_path):
-        """
-        Loads a CSV file into the class's DataFrame attribute.
-        """
-        try:
-            self.data_frame = pd.read_csv(file_path)
-        except Exception as e:
-            print(f"Error loading the file: {e}")
-            self.data_frame = None
-
-
-
-    def sort_dataframe(self):
+    def update_dataset_cache(self):
         """
-        Sorts the class's DataFrame based on specified columns.
+        Updates the values derived from the trial blocks of the DataFrame.
         """
-        self.data_frame = self.data_frame.sort_values(
-            by=['Session', 'TrialIndex'])
+        self.total_trials = len(self.data_frame) // 500
+        self.status_column_index = self.data_frame.columns.get_loc(
+            'Status') if 'Status' in self.data_frame.columns else None
+        if self.data_frame.empty:
+            self.time_values = self.net_force = np.empty((0, 500))
+        else:
+            trial_rows = self.total_trials * 500
+            self.time_values = self.data_frame['Time(ms)'].to_numpy()[
+                               :trial_rows].reshape(-1, 500)
+            encl1_values = self.data_frame['Encl 1'].to_numpy()[
+                           :trial_rows].reshape(-1, 500)
+            self.net_force = encl1_values - np.median(encl1_values, axis=1,
+                                                      keepdims=True)
 
     def update_enclosure_limits(self):
         """
@@ -602,29 +691,31 @@ class TrialApp(tk.Tk):
             self.data_frame = self.data_frame[
                 self.data_frame['Status'] != 'Rejected']
             self.current_trial_index = 0
+            self.update_dataset_cache()
             self.update_plot()
             self.update_rejected_trials_list()
 
-    def populate_rejected_trials_treeview(self):
+    def clear_rejected_trials_treeview(self):
         """
-        Populates the treeview with the titles of rejected trials.
+        Removes all rows from the rejected trials treeview.
         """
-        for widget in self.rejected_trials_frame.winfo_children():
-            widget.destroy()
-
-        tree = ttk.Treeview(self.rejected_trials_frame, selectmode='none',
-                            show="tree")
-        tree['columns'] = 0
-        tree.column("#0", width=0, stretch=tk.NO, anchor="w")
+        self.rejected_trials_tree.delete(
+            *self.rejected_trials_tree.get_children())
+        self.rejected_trial_items.clear()
 
-        for title in self.rejected_trials_list:
-            tree.insert("", tk.END, values=(title,))
+    def insert_rejected_trial(self, trial_number, trial_info):
+        """
+        Appends a rejected trial to the rejected trials treeview.
+        """
+        self.rejected_trial_items[trial_number] = \
+            self.rejected_trials_tree.insert("", tk.END, values=(trial_info,))
 
-        scrollbar = ttk.Scrollbar(self.rejected_trials_frame,
-                                  command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y", pady=(8, 12))
-        tree.pack(side="left", fill="both", expand=True, pady=(2, 5))
+    def delete_rejected_trial(self, trial_number):
+        """
+        Removes a trial from the rejected trials treeview.
+        """
+        self.rejected_trials_tree.delete(
+            self.rejected_trial_items.pop(trial_number))
 
     def close_application(self):
         """